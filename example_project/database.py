@@ -1,22 +1,19 @@
+from pathlib import Path
 from typing import Optional
 
 from microrm import MicrORMDatabase
 
 
 class MyDatabase(MicrORMDatabase):
-    def __init__(self, db_name: str = "db.sqlite3", db_path: str = None):
-        super().__init__(db_name, db_path)
+    def __init__(
+        self, db_name: str = "db.sqlite3", db_path: str = None, base_dir: Path = None
+    ):
+        super().__init__(db_name, db_path, base_dir)
 
     def get_all_users(self, limit: int = None):
         from models import User
 
-        users = User.all()
-
-        if users:
-            if limit is None:
-                return users
-
-            return users[:limit]
+        return User.all(limit=limit)
 
     def create_user(
         self, name: str, email: Optional[str] = None, ignore_conflicts: bool = False
@@ -25,6 +22,18 @@ class MyDatabase(MicrORMDatabase):
 
         return User(name=name, email=email).save(ignore_conflicts=ignore_conflicts)
 
+    def bulk_create_users(
+        self,
+        users: list[tuple[str, Optional[str]]],
+        ignore_conflicts: bool = False,
+    ):
+        from models import User
+
+        return User.bulk_create(
+            [User(name=name, email=email) for name, email in users],
+            ignore_conflicts=ignore_conflicts,
+        )
+
 
 # Shared database instance used by models and application code.
-db = MyDatabase(db_name="hello_world.sqlite")
+db = MyDatabase(db_name="hello_world.sqlite", base_dir=Path(__file__).parent)
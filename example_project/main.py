@@ -23,8 +23,9 @@ user_names = [
     "Clara",
 ]
 
-for user in user_names:
-    db.create_user(name=user, email=f"{user}@gmail.com", ignore_conflicts=True)
+db.bulk_create_users(
+    [(name, f"{name}@gmail.com") for name in user_names], ignore_conflicts=True
+)
 
 users = db.get_all_users()
 
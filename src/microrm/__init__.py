@@ -1,92 +1,213 @@
-import inspect
+import logging
 import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import fields, is_dataclass
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from types import NoneType, UnionType
-from typing import Any, Tuple, get_args, get_origin
+from types import NoneType
+from typing import Any, Callable, Tuple, get_args, get_origin, get_type_hints
+
+logger = logging.getLogger(__name__)
+
+_SQLITE_TYPES = {
+    int: "INTEGER",
+    bool: "INTEGER",
+    float: "REAL",
+    bytes: "BLOB",
+    str: "TEXT",
+}
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    # Optional[X] and X | None are treated as X.
+    if get_origin(annotation) is not None and NoneType in get_args(annotation):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def _sqlite_type_from_annotation(annotation: Any) -> str:
+    # Enums (stored by value) and any unmapped annotation fall back to TEXT.
+    return _SQLITE_TYPES.get(_unwrap_optional(annotation), "TEXT")
+
+
+def _is_scalar_annotation(annotation: Any) -> bool:
+    return _unwrap_optional(annotation) in _SQLITE_TYPES
+
+
+def _maybe_enum_field_names(model_cls: type) -> frozenset[str]:
+    """Return the names of the fields that may hold an Enum member.
+
+    Only fields annotated with a plain scalar type (`str`, `int`, `float`,
+    `bytes`, `bool`, or Optional of those) are left out. Enum, `Any`/`object`
+    and unresolvable annotations are all kept, so their values still get a
+    runtime `isinstance(value, Enum)` check.
+    """
+    try:
+        # Resolves string annotations (`from __future__ import annotations`).
+        hints = get_type_hints(model_cls)
+    except (NameError, TypeError):
+        hints = {}
+    return frozenset(
+        f.name
+        for f in fields(model_cls)
+        if not _is_scalar_annotation(hints.get(f.name, f.type))
+    )
+
+
+def _params_getter(columns: tuple[str, ...], enum_columns: frozenset[str]):
+    """Build a function returning an instance's values for `columns` as a tuple.
+
+    Values are read with a single `attrgetter` call; Enum members found in
+    `enum_columns` are converted to their `.value`. Other columns are known
+    to hold plain scalars and are passed through unchecked.
+    """
+    if not columns:
+        return lambda obj: ()
+
+    getter = attrgetter(*columns)
+    if len(columns) == 1:
+        single_getter = getter
+
+        def getter(obj):
+            return (single_getter(obj),)
+
+    enum_positions = [i for i, name in enumerate(columns) if name in enum_columns]
+    if not enum_positions:
+        return getter
+
+    def params(obj):
+        values = list(getter(obj))
+        for i in enum_positions:
+            if isinstance(values[i], Enum):
+                values[i] = values[i].value
+        return tuple(values)
+
+    return params
 
 
 class MicrORMDatabase:
+    # The database API is synchronous by design; a serial loop of sqlite3 calls
+    # is much faster than awaiting each one. See microrm.aio for async callers.
+    is_async = False
+
     def __init__(
-        self, db_name: str = "db.sqlite3", db_path: str | Path | None = None
+        self,
+        db_name: str = "db.sqlite3",
+        db_path: str | Path | None = None,
+        base_dir: str | Path | None = None,
+        cached_statements: int = 256,
+        tuning: bool = True,
+        row_factory: Callable | None = None,
     ) -> None:
-        resolved_db_path = self.__resolve_db_path(db_name=db_name, db_path=db_path)
+        resolved_db_path = self.__resolve_db_path(
+            db_name=db_name, db_path=db_path, base_dir=base_dir
+        )
         resolved_db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.db_path = str(resolved_db_path)
-        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.__cached_statements = cached_statements
+        self.__tuning = tuning
+        self.__row_factory = row_factory
+
+        # Each thread gets its own connection so queries from different threads
+        # do not serialize on one sqlite3 handle; WAL lets them read concurrently.
+        self.__local = threading.local()
+        self.__connections: dict[threading.Thread, sqlite3.Connection] = {}
+        self.__connections_lock = threading.Lock()
+        self.__connect()
 
     ############ GLOBALS ############
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            connection = self.__connect()
+        return connection
+
+    def __connect(self) -> sqlite3.Connection:
+        # sqlite3 keeps compiled statements in an LRU keyed by SQL text; model
+        # SQL is built once at registration so repeated calls hit this cache.
+        # check_same_thread is off only so close() can reach every thread's
+        # connection; each connection is otherwise used by its own thread.
+        connection = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.__cached_statements,
+        )
+        self.__configure_connection(connection, tuning=self.__tuning)
+        if self.__row_factory is not None:
+            connection.row_factory = self.__row_factory
+
+        with self.__connections_lock:
+            # Close connections left behind by threads that have exited.
+            for thread in [t for t in self.__connections if not t.is_alive()]:
+                self.__connections.pop(thread).close()
+            self.__connections[threading.current_thread()] = connection
+
+        self.__local.connection = connection
+        return connection
+
+    def __configure_connection(self, connection: sqlite3.Connection, tuning: bool):
+        # One-shot setup runs through executescript, which bypasses sqlite3's
+        # statement cache and leaves its slots to the reusable model SQL.
+        script = "PRAGMA foreign_keys = ON;"
+        if tuning:
+            # WAL + synchronous=NORMAL trades one fsync per commit for a
+            # checkpointed log; journal_mode=WAL persists in the database file.
+            script += """
+                PRAGMA journal_mode = WAL;
+                PRAGMA synchronous = NORMAL;
+                PRAGMA temp_store = MEMORY;
+                PRAGMA cache_size = -65536;
+                """
+        connection.executescript(script)
+
     def __close_connection(self):
-        if self.connection:
-            self.connection.close()
+        with self.__connections_lock:
+            for connection in self.__connections.values():
+                connection.close()
+            self.__connections.clear()
+
+    def _close_thread_connection(self):
+        # Close the calling thread's connection only; other threads keep theirs.
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            return
+        with self.__connections_lock:
+            self.__connections.pop(threading.current_thread(), None)
+        self.__local.connection = None
+        connection.close()
 
     ############ FILESYSTEM ############
-    def __caller_script_dir(self) -> Path:
-        current_file = Path(__file__).resolve()
-        frame = inspect.currentframe()
-        try:
-            frame = frame.f_back
-            while frame:
-                filename = frame.f_code.co_filename
-                if filename and filename != "<stdin>":
-                    frame_path = Path(filename).resolve()
-                    if frame_path != current_file:
-                        return frame_path.parent
-                frame = frame.f_back
-        finally:
-            del frame
-
-        return Path.cwd()
-
-    def __resolve_db_path(self, db_name: str, db_path: str | Path | None) -> Path:
+    def __resolve_db_path(
+        self, db_name: str, db_path: str | Path | None, base_dir: str | Path | None
+    ) -> Path:
         if db_path is None:
-            return (self.__caller_script_dir() / db_name).resolve()
+            base_dir = Path(base_dir) if base_dir else Path.cwd()
+            return (base_dir / db_name).resolve()
 
         base_path = Path(db_path).expanduser()
         raw_path = str(db_path)
 
-        if (base_path.exists() and base_path.is_dir()) or raw_path.endswith(
-            ("/", "\\")
-        ):
+        # Check the trailing separator first; is_dir() is a single stat call.
+        if raw_path.endswith(("/", "\\")) or base_path.is_dir():
             return (base_path / db_name).resolve()
 
         return base_path.resolve()
 
     ############ TABLES ############
-    def __create_table(
-        self, table_name: str, columns: list[str]
-    ) -> Tuple[bool, int, int]:
+    def __create_table_sql(self, table_name: str, columns: list[str]) -> str:
         columns_sql = ", ".join(columns)
-        query = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_sql})"
-        return self.execute_query(query)
-
-    def __sqlite_type_from_annotation(self, annotation: Any) -> str:
-        origin = get_origin(annotation)
-        if origin in (UnionType,):
-            args = [arg for arg in get_args(annotation) if arg is not NoneType]
-            if len(args) == 1:
-                annotation = args[0]
-        elif origin is not None and type(None) in get_args(annotation):
-            args = [arg for arg in get_args(annotation) if arg is not type(None)]
-            if len(args) == 1:
-                annotation = args[0]
-
-        if annotation in (int, bool):
-            return "INTEGER"
-        if annotation is float:
-            return "REAL"
-        if annotation is bytes:
-            return "BLOB"
-        if annotation is str:
-            return "TEXT"
-        if isinstance(annotation, type) and issubclass(annotation, Enum):
-            return "TEXT"
-        return "TEXT"
-
-    def __create_tables_from_model_class(self, model_cls: type):
+        return f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_sql})"
+
+    def __table_from_model_class(self, model_cls: type) -> Tuple[str, list[str]]:
         # Table name resolution order:
         # 1) Meta.table or Meta.__table__
         # 2) class-level __table__
@@ -150,7 +271,7 @@ class MicrORMDatabase:
 
         for field in model_fields:
             col_name = field.name
-            col_type = self.__sqlite_type_from_annotation(field.type)
+            col_type = _sqlite_type_from_annotation(field.type)
 
             if primary_key and col_name == primary_key:
                 if col_type == "INTEGER":
@@ -163,44 +284,321 @@ class MicrORMDatabase:
         if unique_columns:
             column_defs.append(f"UNIQUE ({', '.join(unique_columns)})")
 
-        return self.__create_table(table_name, column_defs)
+        select_columns = [f.name for f in model_fields]
+        if primary_key and primary_key not in field_names:
+            select_columns.insert(0, primary_key)
+        model_cls._select_columns = tuple(select_columns)
+        model_cls._sql_select_all = (
+            f"SELECT {', '.join(select_columns)} FROM {table_name}"
+        )
+        insert_columns = [f.name for f in model_fields if f.name != primary_key]
+        model_cls._insert_columns = tuple(insert_columns)
+        model_cls._sql_insert = (
+            f"INSERT INTO {table_name} ({', '.join(insert_columns)}) "
+            f"VALUES ({', '.join('?' for _ in insert_columns)})"
+            if insert_columns
+            # A model with only a primary key has nothing to bind.
+            else f"INSERT INTO {table_name} DEFAULT VALUES"
+        )
+        set_sql = (
+            ", ".join(f"{c}=?" for c in insert_columns)
+            if insert_columns
+            else f"{primary_key}={primary_key}"
+        )
+        model_cls._sql_update = (
+            f"UPDATE {table_name} SET {set_sql} WHERE {primary_key}=?"
+            if primary_key
+            else None
+        )
+        # SQLite rejects ON CONFLICT after DEFAULT VALUES; with no other
+        # column, the only possible unique column is the autoincrement key.
+        model_cls._sql_on_conflict_ignore = (
+            f" ON CONFLICT({', '.join(unique_columns)}) DO NOTHING"
+            if unique_columns and insert_columns
+            else ""
+        )
+        model_cls._sql_insert_ignore = (
+            model_cls._sql_insert + model_cls._sql_on_conflict_ignore
+        )
+        # BaseModel subclasses computed this in __init_subclass__.
+        maybe_enum_fields = getattr(model_cls, "__microrm_maybe_enum_fields__", None)
+        if maybe_enum_fields is None:
+            maybe_enum_fields = _maybe_enum_field_names(model_cls)
+        model_cls._insert_params = staticmethod(
+            _params_getter(model_cls._insert_columns, maybe_enum_fields)
+        )
+        # The row layout is fixed from here on, so reads reuse one builder.
+        row_builder = getattr(model_cls, "_row_builder", None)
+        if row_builder is not None:
+            model_cls._build_row = staticmethod(row_builder())
+
+        return table_name, column_defs
+
+    ############ ROWS ############
+    def _insert_many(
+        self,
+        table_name: str,
+        columns: list[str],
+        rows: list[tuple],
+        conflict_sql: str = "",
+        max_rows_per_statement: int | None = None,
+        raise_on_error: bool = False,
+    ) -> Tuple[bool, int, int]:
+        # Pack as many rows per INSERT as SQLite's bound-variable and statement
+        # length limits allow, so thousands of rows run as a few statements.
+        connection = self.connection
+        if not columns:
+            # Rows without values cannot share a statement; insert each one
+            # with its defaults instead.
+            return self.execute_many(
+                f"INSERT INTO {table_name} DEFAULT VALUES",
+                [()] * len(rows),
+                raise_on_error=raise_on_error,
+            )
+        row_sql = f"({', '.join('?' for _ in columns)})"
+        rows_per_statement = max(
+            1,
+            min(
+                connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+                // len(columns),
+                connection.getlimit(sqlite3.SQLITE_LIMIT_SQL_LENGTH)
+                // (2 * (len(row_sql) + 2)),
+            ),
+        )
+        if max_rows_per_statement:
+            rows_per_statement = min(rows_per_statement, max_rows_per_statement)
+        full_chunks, remainder = divmod(len(rows), rows_per_statement)
+        head = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES "
 
-    def _register_model(self, model_cls: type):
+        def flatten(chunk):
+            return [value for row in chunk for value in row]
+
+        in_transaction = getattr(self.__local, "in_transaction", False)
+        cursor = connection.cursor()
+        rowcount = 0
+        try:
+            with self.transaction():
+                if full_chunks:
+                    query = head + ", ".join([row_sql] * rows_per_statement)
+                    cursor.executemany(
+                        query + conflict_sql,
+                        (
+                            flatten(rows[start : start + rows_per_statement])
+                            for start in range(
+                                0, full_chunks * rows_per_statement, rows_per_statement
+                            )
+                        ),
+                    )
+                    rowcount += cursor.rowcount
+                if remainder:
+                    query = head + ", ".join([row_sql] * remainder)
+                    cursor.execute(
+                        query + conflict_sql, flatten(rows[len(rows) - remainder :])
+                    )
+                    rowcount += cursor.rowcount
+            return True, rowcount, cursor.lastrowid
+        except sqlite3.Error as e:
+            # Inside a caller's transaction, earlier chunks would otherwise
+            # commit with it.
+            if raise_on_error or in_transaction:
+                raise
+            logger.error("Query failed: %s", e)
+            return False, rowcount, cursor.lastrowid
+
+    def _tuple_cursor(self) -> sqlite3.Cursor:
+        # Model reads index rows by position, so they ignore the connection's
+        # row_factory and always get plain tuples.
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        return cursor
+
+    def _fetch_tuples(self, query, params=None) -> list[tuple]:
+        # fetch_all() for model reads.
+        try:
+            return self._tuple_cursor().execute(query, params or ()).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Query failed: %s", e)
+            return []
+
+    def _iter_tuples(self, query, params=None, arraysize: int = 1000):
+        # iter_rows() for model reads.
+        try:
+            cursor = self._tuple_cursor().execute(query, params or ())
+            while rows := cursor.fetchmany(arraysize):
+                yield from rows
+        except sqlite3.Error as e:
+            logger.error("Query failed: %s", e)
+
+    def __check_model_class(self, model_cls: type):
         if not isinstance(model_cls, type) or not is_dataclass(model_cls):
             raise TypeError(
-                "The SQLiteDatabase.register_model() method expects a dataclass model class."
+                "MicrORMDatabase can only register dataclass model classes."
             )
-        result = self.__create_tables_from_model_class(model_cls)
-        setattr(model_cls, "__microrm_registered__", True)
-        return result
+
+    def _register_model(self, model_cls: type):
+        self._register_all([model_cls])
+
+    def _register_all(self, model_classes: list[type]):
+        # One script, one commit: cheaper than a CREATE TABLE round-trip per
+        # model when many models are set up at once. DDL runs once per table,
+        # so it is kept out of the statement cache as well.
+        for model_cls in model_classes:
+            self.__check_model_class(model_cls)
+        tables = dict(
+            self.__table_from_model_class(model_cls) for model_cls in model_classes
+        )
+
+        # Tables usually exist already on later runs: one lookup in
+        # sqlite_master then replaces parsing a CREATE TABLE per model.
+        connection = self.connection
+        cursor = connection.cursor()
+        cursor.row_factory = None
+        existing = {
+            name
+            for (name,) in cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                f"AND name IN ({', '.join('?' for _ in tables)})",
+                tuple(tables),
+            )
+        }
+        statements = [
+            self.__create_table_sql(table_name, column_defs)
+            for table_name, column_defs in tables.items()
+            if table_name not in existing
+        ]
+        if statements and getattr(self.__local, "in_transaction", False):
+            # executescript() would commit the caller's open transaction first;
+            # SQLite DDL is transactional, so run it as part of that instead.
+            # transaction() unregisters these models again if it rolls back.
+            for statement in statements:
+                connection.execute(statement)
+            self.__local.registered_in_transaction.extend(
+                model_cls
+                for model_cls in model_classes
+                if model_cls.__table__ not in existing
+            )
+        elif statements:
+            with connection:
+                connection.executescript(";\n".join(statements))
+
+        for model_cls in model_classes:
+            setattr(model_cls, "__microrm_registered__", True)
 
     ############ PUBLIC ############
     def close(self):
         self.__close_connection()
 
+    @contextmanager
+    def transaction(self):
+        """Group statements into one transaction, committed once on exit.
+
+        The transaction is opened with BEGIN IMMEDIATE, so it holds the write
+        lock from the start and every statement in the block, including DDL
+        and SELECTs, is rolled back if the block raises. Inside the block,
+        `execute_query`, `execute_many` and `bulk_create` raise on errors
+        instead of returning a sentinel, so a failed write aborts the block.
+        Nested calls run inside a savepoint of the outermost transaction: if a
+        nested block raises, only its own statements are rolled back.
+
+        Example:
+            with db.transaction():
+                for name in ("Ada", "Bob"):
+                    User(name=name).save()
+        """
+        connection = self.connection
+        if getattr(self.__local, "in_transaction", False):
+            # ROLLBACK TO/RELEASE target the most recent savepoint of a name,
+            # so one name serves every nesting level.
+            registered = self.__local.registered_in_transaction
+            registered_before = len(registered)
+            connection.execute("SAVEPOINT microrm")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK TO microrm")
+                connection.execute("RELEASE microrm")
+                for model_cls in registered[registered_before:]:
+                    model_cls.__microrm_registered__ = False
+                del registered[registered_before:]
+                raise
+            connection.execute("RELEASE microrm")
+            return
+
+        self.__local.in_transaction = True
+        self.__local.registered_in_transaction = []
+        try:
+            with connection:
+                # sqlite3 only opens a transaction implicitly before DML, so
+                # anything earlier in the block would otherwise autocommit.
+                # IMMEDIATE takes the write lock now: a deferred transaction
+                # that reads first cannot write once another connection has
+                # committed in between.
+                connection.execute("BEGIN IMMEDIATE")
+                yield connection
+        except BaseException:
+            # Tables created inside the block were rolled back with it.
+            for model_cls in self.__local.registered_in_transaction:
+                model_cls.__microrm_registered__ = False
+            raise
+        finally:
+            self.__local.in_transaction = False
+            self.__local.registered_in_transaction = []
+
+    def register_models(self, *model_classes: type):
+        """Create the tables of several models at once, in a single transaction.
+
+        Example:
+            db.register_models(User, Post, Comment)
+        """
+        self._register_all(list(model_classes))
+
     def execute_query(
         self, query, params=None, raise_on_error: bool = False
     ) -> Tuple[bool, int, int]:
         """Execute a write/query statement and commit changes.
 
+        Inside `transaction()`, the commit is left to the enclosing block.
+
         Example:
             db.execute_query("INSERT INTO users (name) VALUES (?)", ("Ada",))
         """
-        cursor = self.connection.cursor()
+        in_transaction = getattr(self.__local, "in_transaction", False)
         try:
-            if params:
-                cursor.execute(query, params)
+            connection = self.connection
+            if in_transaction:
+                cursor = connection.execute(query, params or ())
             else:
-                cursor.execute(query)
-            self.connection.commit()
+                with connection:
+                    cursor = connection.execute(query, params or ())
             return True, cursor.rowcount, cursor.lastrowid
         except sqlite3.Error as e:
-            if raise_on_error:
+            # A failed write must not let the rest of a transaction commit.
+            if raise_on_error or in_transaction:
                 raise
-            print(f"An error occurred executing query: {e}")
+            logger.error("Query failed: %s", e)
+            return False, -1, None
+
+    def execute_many(
+        self, query, seq_params, raise_on_error: bool = False
+    ) -> Tuple[bool, int, int]:
+        """Execute a statement once per parameter set and commit once.
+
+        Example:
+            db.execute_many("INSERT INTO users (name) VALUES (?)", [("Ada",), ("Bob",)])
+        """
+        in_transaction = getattr(self.__local, "in_transaction", False)
+        cursor = self.connection.cursor()
+        try:
+            with self.transaction():
+                cursor.executemany(query, seq_params)
+            return True, cursor.rowcount, cursor.lastrowid
+        except sqlite3.Error as e:
+            if raise_on_error or in_transaction:
+                raise
+            logger.error("Query failed: %s", e)
             return False, cursor.rowcount, cursor.lastrowid
 
-    def fetch_all(self, query, params=None):
+    def fetch_all(self, query, params=None, raise_on_error: bool = False):
         """Return all rows for a SELECT query.
 
         Example:
@@ -214,10 +612,56 @@ class MicrORMDatabase:
                 cursor.execute(query)
             return cursor.fetchall()
         except sqlite3.Error as e:
-            print(f"An error occurred: {e}")
+            if raise_on_error:
+                raise
+            logger.error("Query failed: %s", e)
+            return []
+
+    def fetch_as(
+        self, model_cls: type, query, params=None, raise_on_error: bool = False
+    ):
+        """Return the rows of a SELECT query as `model_cls` instances.
+
+        Rows are passed positionally, so the selected columns must follow the
+        order of the model's fields.
+
+        Example:
+            users = db.fetch_as(User, "SELECT name, email FROM user")
+        """
+        try:
+            cursor = self._tuple_cursor().execute(query, params or ())
+            return [model_cls(*row) for row in cursor]
+        except sqlite3.Error as e:
+            if raise_on_error:
+                raise
+            logger.error("Query failed: %s", e)
             return []
 
-    def fetch_one(self, query, params=None):
+    def iter_rows(
+        self,
+        query,
+        params=None,
+        arraysize: int = 1000,
+        raise_on_error: bool = False,
+    ):
+        """Yield rows for a SELECT query without materializing the full result.
+
+        Rows are pulled from SQLite `arraysize` at a time.
+
+        Example:
+            for row in db.iter_rows("SELECT id, name FROM users"):
+                print(row)
+        """
+        try:
+            cursor = self.connection.execute(query, params or ())
+            while rows := cursor.fetchmany(arraysize):
+                yield from rows
+        except sqlite3.Error as e:
+            if raise_on_error:
+                raise
+            logger.error("Query failed: %s", e)
+
+    def fetch_one(self, query, params=None, raise_on_error: bool = False):
         """Return the first row for a SELECT query.
 
         Example:
@@ -231,5 +675,7 @@ class MicrORMDatabase:
                 cursor.execute(query)
             return cursor.fetchone()
         except sqlite3.Error as e:
-            print(f"An error occurred: {e}")
+            if raise_on_error:
+                raise
+            logger.error("Query failed: %s", e)
             return None
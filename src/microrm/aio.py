@@ -0,0 +1,66 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from microrm import MicrORMDatabase
+
+
+class AsyncMicrORMDatabase:
+    """Async facade over a `MicrORMDatabase` for many concurrent callers.
+
+    Every call runs on one dedicated worker thread, which owns its own
+    connection: the event loop is never blocked and writes stay serialized.
+    Only use it when several coroutines share the database (e.g. a web
+    server); a serial loop is faster on the sync class directly.
+
+    Example:
+        adb = AsyncMicrORMDatabase(db)
+        rows = await adb.fetch_all("SELECT id, name FROM user")
+        users = await adb.run(User.filter, name="Ada")
+    """
+
+    is_async = True
+
+    def __init__(self, database: MicrORMDatabase) -> None:
+        self.database = database
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="microrm"
+        )
+
+    async def run(self, func, /, *args, **kwargs):
+        """Run a sync callable, such as a model method, on the worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.__executor, partial(func, *args, **kwargs)
+        )
+
+    async def execute_query(self, query, params=None, raise_on_error: bool = False):
+        return await self.run(
+            self.database.execute_query, query, params, raise_on_error=raise_on_error
+        )
+
+    async def execute_many(self, query, seq_params, raise_on_error: bool = False):
+        return await self.run(
+            self.database.execute_many,
+            query,
+            seq_params,
+            raise_on_error=raise_on_error,
+        )
+
+    async def fetch_all(self, query, params=None, raise_on_error: bool = False):
+        return await self.run(
+            self.database.fetch_all, query, params, raise_on_error=raise_on_error
+        )
+
+    async def fetch_one(self, query, params=None, raise_on_error: bool = False):
+        return await self.run(
+            self.database.fetch_one, query, params, raise_on_error=raise_on_error
+        )
+
+    async def close(self):
+        """Close the worker thread's connection and stop the worker.
+
+        The wrapped database stays open for its other threads.
+        """
+        await self.run(self.database._close_thread_connection)
+        self.__executor.shutdown(wait=False)
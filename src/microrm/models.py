@@ -1,9 +1,73 @@
 from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
+from inspect import Parameter, signature
+from itertools import starmap
 from typing import Any
 
+from microrm import _maybe_enum_field_names
+
+# Per-class limit on cached SELECT/UPDATE shapes; further shapes are still
+# built and run, just not kept, so one-off queries cannot crowd the cache.
+_MAX_CACHED_SHAPES = 64
+
+
+def _make_as_db_dict(
+    field_names: tuple[str, ...],
+    primary_key: str | None,
+    maybe_enum_fields: frozenset[str],
+):
+    """Generate a straight-line `_as_db_dict` for one model layout.
+
+    Like dataclasses' own generated `__init__`, the loop over fields is
+    unrolled once per class instead of on every call. Fields annotated with a
+    plain scalar type are read as is; the others get a `.value` conversion
+    when they hold an Enum member.
+    """
+    lines = ["def _as_db_dict(self):"]
+    items = []
+    for i, name in enumerate(field_names):
+        if name in maybe_enum_fields:
+            lines.append(f"    _{i} = self.{name}")
+            items.append(f"{name!r}: _{i}.value if isinstance(_{i}, Enum) else _{i}")
+        else:
+            items.append(f"{name!r}: self.{name}")
+    if primary_key and primary_key not in field_names:
+        items.append(f"{primary_key!r}: getattr(self, {primary_key!r}, None)")
+    lines.append(f"    return {{{', '.join(items)}}}")
+
+    namespace = {}
+    exec("\n".join(lines), {"Enum": Enum}, namespace)
+    return namespace["_as_db_dict"]
+
+
+def _positional_init_names(model_cls: type) -> tuple[str, ...] | None:
+    """Return the parameters `__init__` binds positionally, in order.
+
+    Unlike `dataclasses.fields()`, this includes `InitVar` pseudo-fields.
+    None means a row cannot be passed positionally at all, e.g. because of
+    a required keyword-only parameter.
+    """
+    try:
+        parameters = signature(model_cls).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    positional = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+    names = []
+    for parameter in parameters:
+        if parameter.kind in positional:
+            names.append(parameter.name)
+        elif (
+            parameter.kind is Parameter.KEYWORD_ONLY
+            and parameter.default is Parameter.empty
+        ):
+            return None
+    return tuple(names)
+
 
 class BaseModel:
+    # Empty slots keep instances of `@dataclass(slots=True)` models dict-free.
+    __slots__ = ()
+
     class DoesNotExist(LookupError):
         pass
 
@@ -12,7 +76,28 @@ class BaseModel:
 
     __table__: str
     _db = None  # inject the MicrORMDatabase subclass instance
+    _pk: str | None = "id"  # resolved Meta.pk
+    _unique: tuple[str, ...] = ()  # resolved Meta.unique
+    _pk_in_fields = False  # whether the primary key is a declared dataclass field
+    _init_positional_names: tuple[str, ...] | None = None  # see _decode_rows()
+    # SQL derived from the model layout, filled in when the table is registered
+    _select_columns: tuple[str, ...] = ()
+    _insert_columns: tuple[str, ...] = ()
+    _sql_select_all: str
+    _sql_insert: str
+    _sql_insert_ignore: str  # _sql_insert + _sql_on_conflict_ignore
+    _sql_update: str | None  # UPDATE of all _insert_columns by primary key
+    _sql_on_conflict_ignore: str = ""
+    _insert_params = None  # instance -> tuple of values for _insert_columns
+    _build_row = None  # selected row -> instance, from _row_builder()
+    _select_cache: dict[tuple, str]  # see _build_select()
+    _update_cache: dict[tuple[str, ...], str]  # UPDATE SQL per update_fields
     __microrm_registered__ = False
+    # Dataclass field names, cached per subclass in __init_subclass__
+    __microrm_field_names__: tuple[str, ...] = ()
+    __microrm_field_name_set__: frozenset[str] = frozenset()
+    __microrm_valid_filter_fields__: frozenset[str] = frozenset()  # fields + pk
+    __microrm_maybe_enum_fields__: frozenset[str] = frozenset()  # non-scalar fields
 
     class Meta:
         database = None
@@ -36,6 +121,39 @@ class BaseModel:
         cls._db = getattr(meta, "database", None)
         cls.__microrm_registered__ = False
 
+        # The field layout is fixed once the dataclass exists; cache it instead
+        # of walking dataclasses.fields() on every save and query.
+        cls.__microrm_field_names__ = tuple(f.name for f in fields(cls))
+        cls.__microrm_field_name_set__ = frozenset(cls.__microrm_field_names__)
+        cls._init_positional_names = _positional_init_names(cls)
+        cls._select_cache = {}
+        cls._update_cache = {}
+
+        # Meta is validated once here; call sites read the plain class attributes.
+        cls._pk = primary_key = cls._meta_pk()
+        cls._unique = cls._meta_unique()
+        cls._pk_in_fields = primary_key in cls.__microrm_field_name_set__
+        cls.__microrm_valid_filter_fields__ = (
+            cls.__microrm_field_name_set__ | {primary_key}
+            if primary_key
+            else cls.__microrm_field_name_set__
+        )
+
+        if (
+            "__slots__" in cls.__dict__
+            and primary_key
+            and primary_key not in cls.__microrm_field_name_set__
+        ):
+            raise TypeError(
+                f"Slotted models must declare their primary key as a field, e.g. "
+                f"`{primary_key}: int | None = None`."
+            )
+
+        cls.__microrm_maybe_enum_fields__ = _maybe_enum_field_names(cls)
+        cls._as_db_dict = _make_as_db_dict(
+            cls.__microrm_field_names__, primary_key, cls.__microrm_maybe_enum_fields__
+        )
+
     @classmethod
     def _meta_pk(cls) -> str | None:
         pk = getattr(getattr(cls, "Meta", None), "pk", "id")
@@ -76,125 +194,338 @@ class BaseModel:
         if not cls.__microrm_registered__:
             db._register_model(cls)
             cls.__microrm_registered__ = True
-
-    def _as_db_dict(self):
-        out = {}
-        primary_key = self.__class__._meta_pk()
-        for f in fields(self):
-            v = getattr(self, f.name)
-            out[f.name] = v.value if isinstance(v, Enum) else v
-        if primary_key and primary_key not in out:
-            out[primary_key] = getattr(self, primary_key, None)
-        return out
+            cls._select_cache.clear()
+            cls._update_cache.clear()
 
     def save(
         self, update_fields: list[str] | None = None, ignore_conflicts: bool = False
     ):
-        self.__class__._ensure_registered()
+        cls = type(self)
+        cls._ensure_registered()
 
-        primary_key = self.__class__._meta_pk()
-        unique_columns = self.__class__._meta_unique()
-        data = self._as_db_dict()
+        # Bind class-level state to locals once; every branch below reads it.
+        db = cls._db
+        primary_key = cls._pk
+        params = cls._insert_params(self)
+        pk_value = getattr(self, primary_key, None) if primary_key else None
 
         # PK style (Django-like)
-        if primary_key and data.get(primary_key) is not None:
-            cols = update_fields or [c for c in data if c != primary_key]
-            set_sql = ", ".join(f"{c}=?" for c in cols)
-            params = tuple(data[c] for c in cols) + (data[primary_key],)
-            q = f"UPDATE {self.__table__} SET {set_sql} WHERE {primary_key}=?"
-            self._db.execute_query(q, params)
+        if pk_value is not None:
+            if update_fields:
+                update_fields = tuple(update_fields)
+                q = cls._update_cache.get(update_fields)
+                if q is None:
+                    set_sql = ", ".join(f"{c}=?" for c in update_fields)
+                    q = f"UPDATE {cls.__table__} SET {set_sql} WHERE {primary_key}=?"
+                    if len(cls._update_cache) < _MAX_CACHED_SHAPES:
+                        cls._update_cache[update_fields] = q
+                data = self._as_db_dict()
+                db.execute_query(q, tuple(data[c] for c in update_fields) + (pk_value,))
+            else:
+                db.execute_query(cls._sql_update, params + (pk_value,))
             return self
 
-        if unique_columns:
-            cols = list(data.keys())
+        if cls._unique:
             if ignore_conflicts:
-                q = f"""
-                INSERT INTO {self.__table__} ({", ".join(cols)})
-                VALUES ({", ".join("?" for _ in cols)})
-                ON CONFLICT({", ".join(unique_columns)}) DO NOTHING
-                """
-                ok, _, last_id = self._db.execute_query(q, tuple(data[c] for c in cols))
-                if ok and primary_key and data.get(primary_key) is None:
-                    setattr(self, primary_key, last_id)
+                ok, inserted, last_id = db.execute_query(cls._sql_insert_ignore, params)
+                # A skipped row leaves lastrowid pointing at an earlier insert.
+                if ok and primary_key:
+                    setattr(self, primary_key, last_id if inserted else None)
                 return self
 
-            q = f"INSERT INTO {self.__table__} ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})"
-            ok, _, last_id = self._db.execute_query(
-                q, tuple(data[c] for c in cols), raise_on_error=True
+            ok, _, last_id = db.execute_query(
+                cls._sql_insert, params, raise_on_error=True
             )
-            if ok and primary_key and data.get(primary_key) is None:
+            if ok and primary_key:
                 setattr(self, primary_key, last_id)
             return self
 
         # Plain insert
-        cols = [c for c in data if c != primary_key]
-        q = f"INSERT INTO {self.__table__} ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})"
-        ok, _, last_id = self._db.execute_query(q, tuple(data[c] for c in cols))
+        ok, _, last_id = db.execute_query(cls._sql_insert, params)
         if ok and primary_key:
             setattr(self, primary_key, last_id)
         return self
 
     @classmethod
-    def _build_model_instance_from_row(
-        cls, row: tuple, select_columns: list[str], model_field_names: list[str]
+    def bulk_create(
+        cls,
+        objs,
+        ignore_conflicts: bool = False,
+        batch_size: int | None = None,
+        returning: bool = False,
     ):
-        row_data = dict(zip(select_columns, row))
-        instance = cls(**{name: row_data[name] for name in model_field_names})
+        """Insert many instances with multi-row INSERTs inside a single transaction.
+
+        `batch_size` caps the rows sent per INSERT statement. Primary keys are
+        only populated on the given instances with `returning=True`, which
+        inserts row by row (still in one transaction) to read each new key.
+
+        If the multi-row insert fails, the error is logged, the transaction
+        is rolled back and an empty list is returned. Inside
+        `db.transaction()`, the error is raised instead.
 
-        primary_key = cls._meta_pk()
-        if primary_key and primary_key not in set(model_field_names):
-            setattr(instance, primary_key, row_data[primary_key])
+        Example:
+            User.bulk_create([User(name="Ada"), User(name="Bob")])
+        """
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer.")
 
-        return instance
+        cls._ensure_registered()
+
+        objs = list(objs)
+        if not objs:
+            return objs
+
+        primary_key = cls._pk
+        unique_columns = cls._unique
+        raise_on_error = bool(unique_columns) and not ignore_conflicts
+
+        rows = list(map(cls._insert_params, objs))
+
+        if returning:
+            q = cls._sql_insert_ignore if ignore_conflicts else cls._sql_insert
+            with cls._db.transaction():
+                for obj, params in zip(objs, rows):
+                    ok, inserted, last_id = cls._db.execute_query(
+                        q, params, raise_on_error=raise_on_error
+                    )
+                    if ok and primary_key:
+                        setattr(obj, primary_key, last_id if inserted else None)
+            return objs
+
+        ok, _, _ = cls._db._insert_many(
+            cls.__table__,
+            cls._insert_columns,
+            rows,
+            cls._sql_on_conflict_ignore if ignore_conflicts else "",
+            max_rows_per_statement=batch_size,
+            raise_on_error=raise_on_error,
+        )
+        return objs if ok else []
 
     @classmethod
-    def _query(cls, filters: dict[str, object], limit: int | None = None):
-        """Run a SELECT on this model table and return matching model instances.
+    def _row_builder(cls):
+        """Return a function that turns one selected row into a model instance.
 
-        Used internally by `filter()` and `get()` to avoid duplicating SQL
-        construction and row-to-instance mapping logic.
+        Rows follow `_select_columns`, so the layout is resolved once, when
+        the table is registered (stored as `_build_row`), and each row is read
+        by position. Whether an implicit primary key needs
+        its own `setattr` is decided here rather than for every row.
         """
-        cls._ensure_registered()
-        primary_key = cls._meta_pk()
+        col_index = {name: i for i, name in enumerate(cls._select_columns)}
+        named_positions = tuple(
+            (name, col_index[name]) for name in cls.__microrm_field_names__
+        )
+
+        def build(row):
+            return cls(**{name: row[position] for name, position in named_positions})
+
+        primary_key = cls._pk
+        if not primary_key or cls._pk_in_fields:
+            return build
 
-        model_field_names = [f.name for f in fields(cls)]
-        model_field_name_set = set(model_field_names)
+        pk_position = col_index[primary_key]
 
-        valid_filter_fields = set(model_field_name_set)
-        if primary_key:
-            valid_filter_fields.add(primary_key)
+        def build_with_pk(row):
+            instance = build(row)
+            setattr(instance, primary_key, row[pk_position])
+            return instance
 
-        unknown_filters = [name for name in filters if name not in valid_filter_fields]
+        return build_with_pk
+
+    @classmethod
+    def _decode_rows(cls, rows):
+        """Return an iterator of model instances built from selected rows.
+
+        When the selected columns are exactly the positional parameters of
+        `__init__`, in order, rows are passed to it through `itertools.starmap`,
+        so no per-row Python frame or kwargs dict is needed. Other layouts
+        (implicit primary key, `InitVar` or keyword-only parameters) go
+        through the `_build_row` set at registration.
+        """
+        if cls._select_columns == cls._init_positional_names:
+            return starmap(cls, rows)
+        return map(cls._build_row, rows)
+
+    @classmethod
+    def _unknown_fields(cls, names) -> list[str]:
+        valid_fields = cls.__microrm_valid_filter_fields__
+        if valid_fields.issuperset(names):
+            return []
+        return [name for name in names if name not in valid_fields]
+
+    @classmethod
+    def _compose_select(
+        cls,
+        filter_names: tuple[str, ...],
+        columns: tuple[str, ...],
+        has_limit: bool,
+        has_offset: bool,
+    ) -> str:
+        unknown_filters = cls._unknown_fields(filter_names)
         if unknown_filters:
             raise ValueError(f"Unknown filter field(s): {', '.join(unknown_filters)}")
 
-        select_columns = list(model_field_names)
-        if primary_key and primary_key not in model_field_name_set:
-            select_columns = [primary_key, *select_columns]
+        select_sql = cls._sql_select_all
+        if columns:
+            unknown_columns = cls._unknown_fields(columns)
+            if unknown_columns:
+                raise ValueError(f"Unknown field(s): {', '.join(unknown_columns)}")
+            select_sql = f"SELECT {', '.join(columns)} FROM {cls.__table__}"
 
         where_sql = ""
-        params = ()
-        if filters:
-            where_sql = " WHERE " + " AND ".join(f"{name}=?" for name in filters)
+        if filter_names:
+            where_sql = " WHERE " + " AND ".join(f"{name}=?" for name in filter_names)
+
+        # SQLite only accepts OFFSET after a LIMIT; -1 means "no limit".
+        limit_sql = ""
+        if has_limit:
+            limit_sql = " LIMIT ?"
+        elif has_offset:
+            limit_sql = " LIMIT -1"
+        if has_offset:
+            limit_sql += " OFFSET ?"
+
+        return f"{select_sql}{where_sql}{limit_sql}"
+
+    @classmethod
+    def _build_select(
+        cls,
+        filters: dict[str, object],
+        limit: int | None = None,
+        offset: int = 0,
+        columns: tuple[str, ...] = (),
+    ):
+        """Validate filters and return the SELECT statement and its parameters.
+
+        Shared by `_query()`, `iterator()` and `values()` so every read builds
+        its SQL the same way. `columns` narrows the selected columns.
+
+        Statements are cached per class by filter names (in call order, which
+        is also the parameter order), columns, and whether limit/offset are
+        used; a cache hit skips validation and string building. Only the
+        first `_MAX_CACHED_SHAPES` shapes are kept, so the cache holds the
+        recurring queries rather than every ad-hoc filter combination.
+        """
+        cls._ensure_registered()
+
+        key = (tuple(filters), columns, limit is not None, bool(offset))
+        query = cls._select_cache.get(key)
+        if query is None:
+            query = cls._compose_select(*key)
+            if len(cls._select_cache) < _MAX_CACHED_SHAPES:
+                cls._select_cache[key] = query
+
+        enum_fields = cls.__microrm_maybe_enum_fields__
+        if enum_fields and not enum_fields.isdisjoint(filters):
+            # Bind Enum members by value, the way save() stores them.
+            params = tuple(
+                value.value
+                if name in enum_fields and isinstance(value, Enum)
+                else value
+                for name, value in filters.items()
+            )
+        else:
             params = tuple(filters.values())
+        if limit is not None:
+            params += (limit,)
+        if offset:
+            params += (offset,)
+        return query, params
+
+    @classmethod
+    def _query(
+        cls, filters: dict[str, object], limit: int | None = None, offset: int = 0
+    ):
+        """Run a SELECT on this model table and return matching model instances.
+
+        Used internally by `filter()` and `get()` to avoid duplicating SQL
+        construction and row-to-instance mapping logic.
+        """
+        query, params = cls._build_select(filters, limit, offset)
+        rows = cls._db._fetch_tuples(query, params)
+
+        return list(cls._decode_rows(rows))
+
+    @classmethod
+    def _query_one(cls, filters: dict[str, object]):
+        """Return the only model instance matching `filters`, or None.
+
+        At most two raw rows are fetched, and an instance is only built when
+        exactly one row matches.
+        """
+        query, params = cls._build_select(filters, limit=2)
+        rows = cls._db._fetch_tuples(query, params)
+        if len(rows) > 1:
+            raise cls.MultipleObjectsReturned(
+                f"get() returned more than one {cls.__name__}."
+            )
+        if not rows:
+            return None
+        return cls._build_row(rows[0])
+
+    @classmethod
+    def iterator(cls, **filters):
+        """Yield matching model instances lazily instead of building a list.
 
-        limit_sql = f" LIMIT {limit}" if limit is not None else ""
-        query = f"SELECT {', '.join(select_columns)} FROM {cls.__table__}{where_sql}{limit_sql}"
-        rows = cls._db.fetch_all(query, params if params else None)
+        Example:
+            for user in User.iterator(active=True):
+                ...
+        """
+        query, params = cls._build_select(filters)
 
-        return [
-            cls._build_model_instance_from_row(row, select_columns, model_field_names)
-            for row in rows
-        ]
+        yield from cls._decode_rows(cls._db._iter_tuples(query, params))
 
     @classmethod
     def filter(cls, **filters):
         return cls._query(filters)
 
     @classmethod
-    def all(cls):
-        """Return all rows from this model table as model instances."""
-        return cls._query({})
+    def values(cls, *field_names: str, **filters):
+        """Return matching rows as plain tuples, without building model instances.
+
+        Tuples hold `field_names` in the given order; with no field names they
+        hold every column (an implicit primary key first, then the fields).
+
+        Example:
+            names = User.values("id", "name", email=None)
+        """
+        query, params = cls._build_select(filters, columns=field_names)
+        return cls._db._fetch_tuples(query, params)
+
+    @classmethod
+    def columns(cls, *field_names: str, **filters) -> dict[str, list]:
+        """Return matching rows column by column instead of row by row.
+
+        The result maps each field name to a list of its values, in row order;
+        with no field names every column is returned. No model instance or
+        per-row dict is built, which suits analytical reads over many rows.
+
+        Example:
+            data = User.columns("id", "name")
+            names = data["name"]
+        """
+        query, params = cls._build_select(filters, columns=field_names)
+        rows = cls._db._fetch_tuples(query, params)
+
+        names = field_names or cls._select_columns
+        if not rows:
+            return {name: [] for name in names}
+        return {name: list(column) for name, column in zip(names, zip(*rows))}
+
+    @classmethod
+    def all(cls, limit: int | None = None, offset: int = 0):
+        """Return rows from this model table as model instances.
+
+        `limit` and `offset` are applied in SQL, so only the requested rows
+        are read from the database. Without them the precomputed
+        `_sql_select_all` is run directly, skipping filter handling.
+        """
+        if limit is not None or offset:
+            return cls._query({}, limit=limit, offset=offset)
+
+        cls._ensure_registered()
+        return list(cls._decode_rows(cls._db._fetch_tuples(cls._sql_select_all)))
 
     @classmethod
     def get(
@@ -203,15 +534,7 @@ class BaseModel:
         if not filters:
             raise ValueError("get() requires at least one keyword filter.")
 
-        matches = cls._query(filters, limit=2)
-        if not matches:
-            if raise_if_not_found is True:
-                raise cls.DoesNotExist(f"{cls.__name__} matching query does not exist.")
-            else:
-                return None
-
-        if len(matches) > 1:
-            raise cls.MultipleObjectsReturned(
-                f"get() returned more than one {cls.__name__}."
-            )
-        return matches[0]
+        match = cls._query_one(filters)
+        if match is None and raise_if_not_found is True:
+            raise cls.DoesNotExist(f"{cls.__name__} matching query does not exist.")
+        return match